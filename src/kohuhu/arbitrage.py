@@ -110,6 +110,16 @@ class OneWayPairArbitrage(trader.Algorithm):
         self.on_data()
 
     def on_data(self):
+        # Nothing useful can be calculated before either exchange has order
+        # book data, e.g. while the exchange clients are still connecting.
+        # Skip the round rather than running the pricing logic on empty books.
+        buy_book = self._state.for_exchange(self.exchange_buy_on).order_book()
+        sell_book = self._state.for_exchange(self.exchange_sell_on).order_book()
+        if not (len(buy_book.bids()) or len(buy_book.asks()) or
+                len(sell_book.bids()) or len(sell_book.asks())):
+            log.debug("Both order books are empty. Nothing to do.")
+            return
+
         # Create a bid limit action if there is none.
         if not self._live_limit_action:
             # Calculate the BTC market price on the exchange to sell on.
@@ -3,14 +3,27 @@ import decimal
 ONE_SATOSHI = decimal.Decimal("0.00000001")
 ONE_CENT = decimal.Decimal("0.01")
 
+_SATOSHI_EXPONENT = 8
+_HALF = decimal.Decimal("0.5")
+
 def round_to_satoshi(unrounded):
     """Round a given Decimal to the nearest satoshi.
 
     Rounding is done in ROUND_HALF_UP mode:
         0-4 -> 0
         5-9 -> 1
+
+    The rounding is carried out on an integer satoshi count, which is cheaper
+    than a Decimal quantize call.
     """
-    return unrounded.quantize(ONE_SATOSHI, decimal.ROUND_HALF_UP)
+    scaled = unrounded.scaleb(_SATOSHI_EXPONENT)
+    satoshis = int(scaled)
+    remainder = scaled - satoshis
+    if remainder >= _HALF:
+        satoshis += 1
+    elif remainder <= -_HALF:
+        satoshis -= 1
+    return decimal.Decimal(satoshis).scaleb(-_SATOSHI_EXPONENT)
 
 
 def round_to_cents(unrounded):
@@ -2,12 +2,18 @@ import getpass
 import argparse
 import argcomplete
 import base64
+import functools
 import random
 from cryptography.fernet import Fernet
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
+# The 100,000 PBKDF2 iterations are deliberately slow. The salt is fixed, so
+# the derived key only depends on the passphrase and can be cached for
+# repeated encrypt/decrypt calls (e.g. tests decrypting the credential file
+# multiple times).
+@functools.lru_cache()
 def key_from_passphrase(passphrase):
     salt = b'\xbf\xcc\x80\xfdv\xafJ\x19\xecN\xbb\xd0\xb1\xd4gW'
     kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32, salt=salt,
@@ -1,9 +1,8 @@
+import bisect
 from decimal import Decimal
 import logging
-import operator
 from enum import Enum
 from enum import auto
-from sortedcontainers import SortedDict
 from datetime import datetime
 
 
@@ -14,6 +13,10 @@ class Side(Enum):
 
 
 class SortedQuotes:
+    # Prices are keyed as integer multiples of this exponent (10^-8, one
+    # satoshi for BTC amounts, well below one cent for fiat prices).
+    _KEY_EXPONENT = 8
+
     def __init__(self, side):
         """A data structure of bid or ask quotes that provides fast lookup of the best nth
         bid / best nth ask using the index operator and fast insertion with set_quote().
@@ -31,27 +34,46 @@ class SortedQuotes:
         # We use a dictionary because when we get an update message it contains only the price levels
         # where the quantity has changed. To afford an efficient update we want to be able to lookup
         # a specific price in O(1) time without having to iterate over the entire orderbook.
-        # We need it to be sorted so that we can use bids[0] to get the highest bid etc.
-        # bid_quotes are ordered in reverse because the first element should have the highest price.
+        # A separate sorted list of prices is kept with bisect so that bids[0]
+        # can get the highest bid etc. Insertion and removal at a price level is
+        # a binary search plus a list shuffle, which is faster than maintaining
+        # a tree for the orderbook sizes we deal with.
+        # Prices are mapped to plain integers (units of 10^-8) for the sort
+        # keys, as integer comparison is much cheaper than Decimal comparison.
+        # Bid keys are stored negated so that the first element is always the
+        # best quote for both sides. The dictionary is keyed by the same
+        # integer key and keeps the original price so that quotes are returned
+        # exactly as they were given.
         if side == Side.BID:
-            self._price_quantity_dict = SortedDict(operator.neg)
+            self._negate_keys = True
         elif side == Side.ASK:
-            self._price_quantity_dict = SortedDict()
+            self._negate_keys = False
         else:
             raise ValueError("Quote side must be supplied")
+        self._sorted_keys = []
+        self._price_quantity_dict = {}
+
+    def _key(self, price):
+        key = int(price.scaleb(self._KEY_EXPONENT))
+        return -key if self._negate_keys else key
 
     def __getitem__(self, index):
-        price = self._price_quantity_dict.iloc[index]
-        quantity = self._price_quantity_dict[price]
+        key = self._sorted_keys[index]
+        price, quantity = self._price_quantity_dict[key]
         return Quote(price, quantity)
 
     def set_quote(self, quote):
         price = quote.price
         quantity = quote.quantity
+        key = self._key(price)
         if quantity == 0:
-            del self._price_quantity_dict[price]
+            del self._price_quantity_dict[key]
+            index = bisect.bisect_left(self._sorted_keys, key)
+            del self._sorted_keys[index]
         else:
-            self._price_quantity_dict[price] = quantity
+            if key not in self._price_quantity_dict:
+                bisect.insort(self._sorted_keys, key)
+            self._price_quantity_dict[key] = (price, quantity)
 
     def __len__(self):
         return len(self._price_quantity_dict)
@@ -18,6 +18,13 @@ import uuid
 
 log = logging.getLogger(__name__)
 
+# orjson parses the large snapshot/l2update messages several times faster
+# than the stdlib json module, but it is an optional extra.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class CoinbaseExchangeAuth(AuthBase):
     def __init__(self, api_key, secret_key, passphrase):
@@ -59,8 +66,16 @@ class GdaxExchange(ExchangeClient):
     sandbox_websocket_url = 'wss://ws-feed-public.sandbox.gdax.com'
     sandbox_rest_api_url = 'https://api-public.sandbox.gdax.com'
 
-    def __init__(self, api_credentials=None, sandbox=False):
-        """Creates a new Gdax Exchange."""
+    def __init__(self, api_credentials=None, sandbox=False,
+                 compression='deflate'):
+        """Creates a new Gdax Exchange.
+
+        Args:
+            compression: the websocket permessage-deflate setting, passed
+                through to websockets.connect(). Pass None to disable
+                compression and save the per-frame inflate cost at the expense
+                of bandwidth.
+        """
         if sandbox:
             self.exchange_id = self.sandbox_exchange_name
             self._websocket_url = self.sandbox_websocket_url
@@ -75,8 +90,10 @@ class GdaxExchange(ExchangeClient):
         self._channels = ['user', 'heartbeat',
                           'level2']  # user channel will only receive messages if authenticated
         self._symbol = 'BTC-USD'
+        self._websocket_compression = compression
         self._websocket = None
         self._message_queue = asyncio.Queue()
+        self._action_queue = asyncio.Queue()
         self._background_task = None
         self._create_actions_by_uuid = {}
         self._cancel_actions = {}
@@ -96,9 +113,19 @@ class GdaxExchange(ExchangeClient):
 
     @staticmethod
     def datetime_from_string(timestamp_str):
-        parsed = datetime.datetime.strptime(timestamp_str,
-                                                    "%Y-%m-%dT%H:%M:%S.%fZ")
-        return parsed
+        """Parses a Gdax timestamp, e.g. '2014-11-07T08:19:28.464459Z'.
+
+        The date and time fields (%Y-%m-%dT%H:%M:%S) are fixed-width, so they
+        are sliced out directly. This is considerably faster than strptime,
+        which matters as every heartbeat message carries a timestamp. The
+        fraction can be 1-6 digits (like strptime's %f), so it is measured up
+        to the trailing 'Z' and right-padded to microseconds.
+        """
+        t = timestamp_str
+        fraction = t[20:t.index('Z', 20)]
+        return datetime.datetime(int(t[0:4]), int(t[5:7]), int(t[8:10]),
+                                 int(t[11:13]), int(t[14:16]), int(t[17:19]),
+                                 int(fraction.ljust(6, '0')))
 
 
     async def run(self):
@@ -135,6 +162,9 @@ class GdaxExchange(ExchangeClient):
         # Checks that we're still receiving messages on the websocket.
         watchdog_coro = self._watchdog()
 
+        # Sends queued actions to the REST API without blocking the event loop.
+        process_actions_coro = self._process_actions()
+
         async def listen_websocket():
             # Open our websocket first
             await self._connect_websocket()
@@ -143,7 +173,7 @@ class GdaxExchange(ExchangeClient):
             await self._listen_websocket_feed()
 
         return asyncio.gather(listen_websocket(), process_messages_coro,
-                              watchdog_coro)
+                              watchdog_coro, process_actions_coro)
 
     async def stop(self):
         """Stop all background tasks and close the websocket"""
@@ -157,7 +187,8 @@ class GdaxExchange(ExchangeClient):
         Open the websocket feed to Gdax for all market data updates, orders
         and trades. Gdax uses a single websocket to feed all information.
         """
-        self._websocket = await websockets.connect(self._websocket_url)
+        self._websocket = await websockets.connect(
+            self._websocket_url, compression=self._websocket_compression)
 
         # We must send a subscribe message within 5 seconds of opening the websocket
         subscribe_message = json.dumps(self._build_subscribe_parameters())
@@ -231,7 +262,12 @@ class GdaxExchange(ExchangeClient):
         interval), subscribers will only be notified once."""
         while True:
             message = await self._message_queue.get()
-            self._handle_message(message)
+            try:
+                self._handle_message(message)
+            finally:
+                # Mark the message as processed so that waiters (e.g. tests)
+                # can use _message_queue.join() instead of polling qsize().
+                self._message_queue.task_done()
             if not self._message_queue.empty():
                 # If we've already got another update, then update our
                 # orderbook before we call notify subscribers.
@@ -243,7 +279,7 @@ class GdaxExchange(ExchangeClient):
     def _handle_message(self, msg):
         """The main handler for all websocket messages. This method will call
         the appropriate sub-handler based on the message type."""
-        message = json.loads(msg)
+        message = _json_loads(msg)
         response_type = message['type']
 
         if response_type == 'snapshot':
@@ -520,6 +556,13 @@ class GdaxExchange(ExchangeClient):
             self.exchange_state.balance().set_on_hold(currency, holds)
 
     def execute_action(self, action):
+        """Queues the given action to be sent to the exchange.
+
+        The REST round-trip is made by a background task (see
+        _process_actions), so this method returns immediately without
+        blocking the event loop; any order updates resulting from the action
+        arrive on the websocket feed as usual. If the request fails, the
+        error is logged and the action's status is set to FAILED."""
         if not self._authenticate:
             raise InvalidOperationError("Exchange is not authenticated. You must authenticate this "
                                         "exchange by supplying apiCredentials to the constructor "
@@ -529,6 +572,28 @@ class GdaxExchange(ExchangeClient):
             raise InvalidOperationError(f"An action for exchange "
                                         f"'{action.exchange}' was given to "
                                         f"GDAX.")
+        self._action_queue.put_nowait(action)
+
+    async def _process_actions(self):
+        """Services the action queue.
+
+        The requests library is synchronous, so the HTTP call is pushed onto
+        the default executor: the websocket reader keeps ingesting messages
+        while the request is in flight, instead of stalling behind it. A
+        failed request only fails its action: a rejected order shouldn't tear
+        down the websocket feed and the rest of run()."""
+        loop = asyncio.get_event_loop()
+        while True:
+            action = await self._action_queue.get()
+            try:
+                await loop.run_in_executor(None, self._execute_action_sync,
+                                           action)
+            except Exception:
+                log.exception(f"Failed to execute action: {action}")
+                action.status = exchanges.Action.Status.FAILED
+
+    def _execute_action_sync(self, action):
+        """Makes the (blocking) REST request for the given action."""
         if type(action) == exchanges.CreateOrder:
             orders_path = "/orders"
             params = self._new_order_parameters(action)
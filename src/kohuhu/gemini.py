@@ -18,9 +18,38 @@ import requests
 from kohuhu.custom_exceptions import *
 
 from decimal import Decimal
+import functools
 
 log = logging.getLogger(__name__)
 
+# orjson decodes websocket frames several times faster than the stdlib json
+# module, but it is an optional extra. Note: only the decode side; payload
+# signing sticks with json.dumps, whose exact output format the signatures
+# (and test_encode_and_sign) depend on.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def _raise_sequence_mismatch(expected_seq, socket_seq):
+    """Raises for a missed socket sequence (cold path of _check_sequence)."""
+    raise Exception("We have missed a socket_sequence. The previous"
+                    f" sequence was {expected_seq} and the "
+                    f"latest is {socket_seq}.")
+
+
+@functools.lru_cache(maxsize=4096)
+def _to_decimal(value):
+    """Decimal(value), with a cache over the result.
+
+    Parsing a Decimal from a string walks it character by character. Order
+    responses repeat the same handful of strings constantly ("0" and "0.00"
+    appear on every unfilled order), so a bounded cache turns most of the
+    parses into a dict hit. Decimals are immutable, so sharing the instances
+    is safe."""
+    return Decimal(value)
+
 
 class OrderResponse:
     """A response from Gemini's order/events endpoint."""
@@ -119,28 +148,20 @@ class OrderResponse:
         # symbol
         response.symbol = json_dict['symbol']
         # side
-        if json_dict['side'] == 'sell':
-            response.side = exchanges.Side.ASK
-        elif json_dict['side'] == 'buy':
-            response.side = exchanges.Side.BID
-        else:
-            raise Exception(f"Unexpected order side: {json_dict['side']}.")
+        side = json_dict['side']
+        response.side = _SIDE_BY_STRING.get(side)
+        if response.side is None:
+            raise Exception(f"Unexpected order side: {side}.")
         # behaviour
         behavior = json_dict.get('behavior', None)
         if behavior:
-            if behavior == 'immediate-or-cancel':
-                response.behavior = cls.Behavior.IMMEDIATE_OR_CANCEL
-            elif behavior == 'maker-or-cancel':
-                response.behavior = cls.Behavior.MAKER_OR_CANCEL
-            else:
+            response.behavior = _BEHAVIOR_BY_STRING.get(behavior)
+            if response.behavior is None:
                 raise Exception(f"Unexpected behaviour type {behavior}.")
         # order_type
         order_type = json_dict['order_type']
-        if order_type == 'exchange limit':
-            response.order_type = exchanges.Order.Type.LIMIT
-        elif json_dict['order_type'] == 'market buy' or 'market sell':
-            response.order_type = exchanges.Order.Type.MARKET
-        else:
+        response.order_type = _ORDER_TYPE_BY_STRING.get(order_type)
+        if response.order_type is None:
             # This might be a little strict: we might manually make
             # our own auction orders which could cause this to be hit.
             raise Exception(f"Unexpected order type: {order_type}.")
@@ -157,28 +178,49 @@ class OrderResponse:
         # avg_execution_price
         if 'avg_execution_price' in json_dict:
             response.avg_execution_price = \
-                Decimal(json_dict['avg_execution_price'])
+                _to_decimal(json_dict['avg_execution_price'])
         # original_amount
         if 'original_amount' in json_dict:
-            response.original_amount = Decimal(json_dict['original_amount'])
+            response.original_amount = _to_decimal(json_dict['original_amount'])
         # executed_amount
         if 'executed_amount' in json_dict:
-            response.executed_amount = Decimal(json_dict['executed_amount'])
+            response.executed_amount = _to_decimal(json_dict['executed_amount'])
         else:
-            response.executed_amount = Decimal(0)
+            response.executed_amount = _to_decimal(0)
         # remaining_amount
         if 'remaining_amount' in json_dict:
-            response.remaining_amount = Decimal(json_dict['remaining_amount'])
+            response.remaining_amount = \
+                _to_decimal(json_dict['remaining_amount'])
         else:
             response.remaining_amount = response.original_amount
         # price
         if 'price' in json_dict:
-            response.price = Decimal(json_dict['price'])
+            response.price = _to_decimal(json_dict['price'])
         # socket_sequence
         response.socket_sequence = json_dict['socket_sequence']
         return response
 
 
+# String to enum translations for OrderResponse.from_json_dict, built once
+# here rather than re-matched with if/elif chains on every message.
+_SIDE_BY_STRING = {
+    'buy': exchanges.Side.BID,
+    'sell': exchanges.Side.ASK,
+}
+
+_ORDER_TYPE_BY_STRING = {
+    'exchange limit': exchanges.Order.Type.LIMIT,
+    'auction-only limit': exchanges.Order.Type.LIMIT,
+    'market buy': exchanges.Order.Type.MARKET,
+    'market sell': exchanges.Order.Type.MARKET,
+}
+
+_BEHAVIOR_BY_STRING = {
+    'immediate-or-cancel': OrderResponse.Behavior.IMMEDIATE_OR_CANCEL,
+    'maker-or-cancel': OrderResponse.Behavior.MAKER_OR_CANCEL,
+}
+
+
 class GeminiExchange(ExchangeClient):
 
     class SocketInfo:
@@ -193,6 +235,12 @@ class GeminiExchange(ExchangeClient):
             queue (asyncio.Queue): a queue used to access the messages received
                 on this websocket.
         """
+        # Slots instead of a per-instance __dict__: the heartbeat/sequence
+        # attributes are read and written for every websocket frame, and slot
+        # access skips the instance dict lookup.
+        __slots__ = ('heartbeat_seq', 'seq', 'heartbeat_timestamp_ms', 'ws',
+                     'connected_event', 'ready', 'queue')
+
         def __init__(self):
             self.heartbeat_seq = 0
             self.seq = 0
@@ -209,7 +257,16 @@ class GeminiExchange(ExchangeClient):
     standard_wss_url_base = "wss://api.gemini.com"
     sandbox_wss_url_base = 'wss://api.sandbox.gemini.com'
 
-    def __init__(self, api_credentials=None, sandbox=False):
+    def __init__(self, api_credentials=None, sandbox=False,
+                 compression='deflate'):
+        """Creates a new Gemini Exchange.
+
+        Args:
+            compression: the websocket permessage-deflate setting, passed
+                through to websockets.connect(). Pass None to disable
+                compression and save the per-frame inflate cost at the expense
+                of bandwidth.
+        """
         exchange_id = self.sandbox_exchange_name if sandbox \
             else self.standard_exchange_name
         super().__init__(exchange_id)
@@ -218,14 +275,28 @@ class GeminiExchange(ExchangeClient):
             else self.standard_rest_url_base
         self._wss_url_base = self.sandbox_wss_url_base if sandbox \
             else self.standard_wss_url_base
+        self._websocket_compression = compression
         self.exchange_state = ExchangeState(self.exchange_id, self)
         self._api_credentials = api_credentials
         self._authenticate = self._api_credentials is not None
-        self._create_actions = []
+        self._hmac_template = None
+        if self._authenticate:
+            # hmac.new() derives the padded inner/outer keys from the secret;
+            # doing that once here and copy()ing per request skips the key
+            # setup on every signature. The secret is ASCII, so the encoding
+            # choice doesn't alter the key bytes.
+            secret_bytes = api_credentials.api_secret.encode("ascii")
+            self._hmac_template = hmac.new(secret_bytes, digestmod=sha384)
+        # Outstanding CreateOrder actions, keyed by id(action) — the value
+        # sent to Gemini as the client_order_id (see _new_order_parameters).
+        self._create_actions = {}
         self._cancel_actions = {}
         self._orders_sock_info = self.SocketInfo()
         self._market_data_sock_info = self.SocketInfo()
-        self._orders = {}
+        # Direct reference to the exchange state's order dict: the order
+        # handlers run per message, and going through order()/set_order()
+        # costs a Python call frame per access for what is a dict lookup.
+        self._orders = self.exchange_state._orders
 
     def _nonce(self):
         """"A nonce for the Gemini exchange API.
@@ -237,22 +308,27 @@ class GeminiExchange(ExchangeClient):
         delta = datetime.datetime.utcnow() - datetime.datetime(1970, 1, 1)
         return int(delta.total_seconds() * 1000)
 
-    def _encode_and_sign(self, dict_payload, encoding="ascii"):
-        """Encode the payload for sending and calculate it's hash signature."""
-        payload_bytes = json.dumps(dict_payload).encode(encoding)
+    def _encode_and_sign(self, dict_payload):
+        """Encode the payload for sending and calculate it's hash signature.
+
+        json.dumps escapes anything outside ASCII by default, so the payload
+        is always ASCII (and thus also valid UTF-8, as the websocket endpoint
+        requires); it is encoded once here rather than per requested
+        encoding."""
+        payload_bytes = json.dumps(dict_payload).encode("ascii")
         b64 = base64.b64encode(payload_bytes)
-        creds = self._api_credentials
-        secret_bytes = creds.api_secret.encode(encoding)
-        signature = hmac.new(secret_bytes, b64, sha384).hexdigest()
+        hmac_sha384 = self._hmac_template.copy()
+        hmac_sha384.update(b64)
+        signature = hmac_sha384.hexdigest()
         return b64, signature
 
-    def _create_headers(self, path, parameters=None, encoding="ascii"):
+    def _create_headers(self, path, parameters=None):
         """Returns the headers to be send with a Gemini API request.
 
         Gemini sends all it's data in the HTTP headers. Data is send in the
-        X-GEMINI-PAYLOAD header. When sending over rest, the data should be
-        encoded in ASCII, and when using websockets, the data should be encoded
-        in UTF-8.
+        X-GEMINI-PAYLOAD header. Rest requests require an ASCII payload and
+        websockets a UTF-8 payload; _encode_and_sign produces ASCII, which
+        satisfies both.
 
         Args:
             path (str): path of the endpoint. Gemini requires the endpoint path
@@ -260,8 +336,6 @@ class GeminiExchange(ExchangeClient):
             parameters (dict): the data to be send in the JSON payload. This
                 method appends the endpoint path and the nonce when sending
                 the parameters.
-            encoding (str): the encoding to use for the payload (ASCII for REST
-                and UTF-8 for websockets).
         """
         if parameters is None:
             parameters = dict()
@@ -270,14 +344,13 @@ class GeminiExchange(ExchangeClient):
             'nonce': self._nonce()
         }
         payload.update(parameters)
-        creds = self._api_credentials
-        b64, signature = self._encode_and_sign(payload, encoding)
+        b64, signature = self._encode_and_sign(payload)
         headers = {
             # I think these two headers are set by default.
             #'Content-Type': 'text/plain',
             #'Content-Length': 0,
-            'X-GEMINI-PAYLOAD': b64.decode(encoding),
-            'X-GEMINI-APIKEY': creds.api_key,
+            'X-GEMINI-PAYLOAD': b64.decode("ascii"),
+            'X-GEMINI-APIKEY': self._api_credentials.api_key,
             'X-GEMINI-SIGNATURE': signature
         }
         return headers
@@ -327,7 +400,7 @@ class GeminiExchange(ExchangeClient):
         require this).
         """
         orders_path = '/v1/order/events'
-        headers = self._create_headers(orders_path, encoding="utf-8")
+        headers = self._create_headers(orders_path)
         # Filter order events so that only events from this key are sent.
         creds = self._api_credentials
         order_events_url = self._wss_url_base + orders_path + \
@@ -335,7 +408,8 @@ class GeminiExchange(ExchangeClient):
 
         # Uncommented until we have the orders websocket working correctly.
         self._orders_sock_info.ws = await websockets.client.connect(
-            order_events_url, extra_headers=headers)
+            order_events_url, extra_headers=headers,
+            compression=self._websocket_compression)
         self._orders_sock_info.connected_event.set()
 
     async def _open_market_data_websocket(self):
@@ -348,7 +422,7 @@ class GeminiExchange(ExchangeClient):
         market_data_url = self._wss_url_base + \
                           '/v1/marketdata/BTCUSD?heartbeat=true'
         self._market_data_sock_info.ws = await websockets.client.connect(
-            market_data_url)
+            market_data_url, compression=self._websocket_compression)
         self._market_data_sock_info.connected_event.set()
 
     async def setup_event(self):
@@ -423,7 +497,7 @@ class GeminiExchange(ExchangeClient):
         while True:
             unparsed_message = await socket_info.queue.get()
             #log.debug("Received: " + unparsed_message)
-            response = json.loads(unparsed_message)
+            response = _json_loads(unparsed_message)
             # Sometimes the response is a list sometimes not. Convert to list.
             message_list = response if type(response) == list else [response]
             if not message_list:
@@ -449,7 +523,11 @@ class GeminiExchange(ExchangeClient):
 
     @staticmethod
     def _check_sequence(response, socket_info):
-        """Checks that the socket sequence of a response is valid."""
+        """Checks that the socket sequence of a response is valid.
+
+        This runs for every websocket frame, so the expected path is kept to
+        a fetch, one compare and a store; the failure messages are formatted
+        in the out-of-line helper below."""
         # Subscription acknowledgement are received before the socket sequence
         # begins. If this is a subscription ack, we don't need to do anything.
         if response['type'] == 'subscription_ack':
@@ -457,12 +535,11 @@ class GeminiExchange(ExchangeClient):
                 raise Exception("Subscription acknowledgements should be sent "
                                 "before the socket sequence is incremented.")
             return
+        expected_seq = socket_info.seq
         socket_seq = response['socket_sequence']
-        if socket_seq != socket_info.seq:
-            raise Exception("We have missed a socket_sequence. The previous"
-                            f" sequence was {socket_info.seq} and the "
-                            f"latest is {socket_seq}.")
-        socket_info.seq += 1
+        if socket_seq != expected_seq:
+            _raise_sequence_mismatch(expected_seq, socket_seq)
+        socket_info.seq = expected_seq + 1
 
     @staticmethod
     def _process_heartbeat(response, socket_info):
@@ -529,6 +606,10 @@ class GeminiExchange(ExchangeClient):
     def _handle_orders(self, response):
         """Update the order records when a message is received on /order/events.
 
+        The response type is dispatched via a handler table built once at
+        class creation, instead of walking an if/elif chain for every
+        message.
+
         Args:
             response (dict): the socket message as a JSON dict.
 
@@ -536,139 +617,156 @@ class GeminiExchange(ExchangeClient):
             bool: True if the underlying exchange state has been changed.
         """
         response_type = response['type']
-        state_updated = False
-        if response_type == "subscription_ack":
-            # Insure the subscription details are expected. Don't do anything.
-            account_id = response['accountId']
-            # TODO: should we do anything with the subscription id?
-            # subscription_id = response['subscriptionId']
-            symbol_filter = response['symbolFilter']
-            api_session_filter = response['apiSessionFilter']
-            event_type_filter = response['eventTypeFilter']
-            if len(symbol_filter) or len(event_type_filter):
-                raise Exception("No symbol or event type were specified, but "
-                                "filters were registered.")
-            if len(api_session_filter) != 1:
-                raise Exception("1 session filter should have been registered."
-                                f"{len(api_session_filter)} were registered.")
-            accepted_key = api_session_filter[0]
-            if accepted_key != self._api_credentials\
-                    .api_key:
-                raise Exception("The whitelisted api session key does not "
-                                "match our session key.")
-        elif response_type == "initial":
-            # Create a new order record for the initial response.
-            order_response = OrderResponse.from_json_dict(response)
-            new_order = exchanges.Order()
-            order_response.update_order(new_order)
-            existing_order = self.exchange_state.order(new_order.order_id)
-            if existing_order:
-                raise Exception("An initial response was received for an "
-                                "existing order (id: {new_order.order_id}).")
-            self.exchange_state.set_order(new_order.order_id, new_order)
-            state_updated = True
-        elif response_type == "accepted":
-            # Create a new order. Mark the corresponding action as successful.
-            order_response = OrderResponse.from_json_dict(response)
-            new_order = exchanges.Order()
-            order_response.update_order(new_order)
-            self.exchange_state.set_order(new_order.order_id, new_order)
-            found_action = False
-            for a in self._create_actions:
-                if id(a) == int(order_response.client_order_id):
-                    if a.order is not None:
-                        raise Exception("An order accept message was received, "
-                                        "but its corresponding action already "
-                                        "has an order (id:{a.order.order_id}).")
-                    a.order = new_order
-                    # I don't know if we need this status.
-                    a.status = exchanges.Action.Status.SUCCESS
-                    found_action = True
-                    break
-            if not found_action:
-                raise Exception("Received an order accept message, but no "
-                                "matching order action was found.")
-            state_updated = True
-        elif response_type == "rejected":
-            order_response = OrderResponse.from_json_dict(response)
-            log.warning(f"An order was rejected. Reason: " + response['reason'])
-            new_order = exchanges.Order()
-            order_response.update_order(new_order)
-            self.exchange_state.set_order(new_order.order_id, new_order)
-            found_action = False
-            for a in self._create_actions:
-                if id(a) == int(order_response.client_order_id):
-                    if a.order is not None:
-                        raise Exception("An order reject message was received, "
-                                        "but its corresponding action already "
-                                        "has an order (id:{a.order.order_id}).")
-                    a.order = new_order
-                    a.status = exchanges.Action.Status.FAILED
-                    found_action = True
-                    break
-            if not found_action:
-                raise Exception("Received an order reject message, but no "
-                                "matching order action was found.")
-            state_updated = True
-        elif response_type == "booked":
-            # I don't think we need to act on this.
-            log.info("Order booked. Order id:{response['order_id']}.")
-        elif response_type == "fill":
-            order_response = OrderResponse.from_json_dict(response)
-            order = self.exchange_state.order(order_response.order_id)
-            if not order:
-                raise Exception("Received a fill response for an unknown order "
-                                f"(id:{order_response.order_id}).")
-            log.info("Order fill response received for order id: "
-                     f"{order_response.order_id}.")
-            order_response.update_order(order)
-            state_updated = True
-            # TODO: we could add some checks here to see if our fee calculation
-            # is correct.
-        elif response_type == "cancelled":
-            order_response = OrderResponse.from_json_dict(response)
-            order = self.exchange_state.order(order_response.order_id)
-            reason = response.get('reason', 'No reason provided.')
-            # Unused:
-            # cancel_command_id = response.get('cancel_command_id', None)
-            if not order:
-                raise Exception("Received a cancelled response for an unknown "
-                                f"order (id:{order_response.order_id}). Reason:"
-                                f"{reason}")
-            log.info("Order fill response received for order id: "
-                     f"{order_response.order_id}. Reason: {reason}")
-            cancel_action = self._cancel_actions.get(order_response.order_id,
-                                                     None)
-            if not cancel_action:
-                raise Exception("Received a cancel response but can't find a "
-                                "matching cancel action.")
-            cancel_action.status = exchanges.Action.Status.SUCCESS
-            state_updated = True
-        elif response_type == "cancel_rejected":
-            order_response = OrderResponse.from_json_dict(response)
-            reason = response.get('reason', 'No reason provided.')
-            log.warning("Failed to cancel order (id: "
-                        f"{order_response.order_id}). Reason: {reason}")
-            cancel_action = self._cancel_actions.get(order_response.order_id,
-                                                     None)
-            if not cancel_action:
-                raise Exception("Received a cancel rejected response but can't "
-                                "find a matching cancel action.")
-            cancel_action.status = exchanges.Action.Status.FAILED
-            state_updated = True
-        elif response_type == "closed":
-            order_response = OrderResponse.from_json_dict(response)
-            order = self.exchange_state.order(order_response.order_id)
-            if not order:
-                raise Exception("Received a close response for an unknown order"
-                                f" (id:{order_response.order_id}).")
-            log.info("Order close response received for order id: "
-                     f"{order_response.order_id}.")
-            order_response.update_order(order)
-            state_updated = True
-        else:
+        handler = self._ORDER_RESPONSE_HANDLERS.get(response_type)
+        if handler is None:
             raise Exception(f"Unexpected response type: {response_type}.")
-        return state_updated
+        return handler(self, response)
+
+    def _on_subscription_ack(self, response):
+        # Insure the subscription details are expected. Don't do anything.
+        account_id = response['accountId']
+        # TODO: should we do anything with the subscription id?
+        # subscription_id = response['subscriptionId']
+        symbol_filter = response['symbolFilter']
+        api_session_filter = response['apiSessionFilter']
+        event_type_filter = response['eventTypeFilter']
+        if len(symbol_filter) or len(event_type_filter):
+            raise Exception("No symbol or event type were specified, but "
+                            "filters were registered.")
+        if len(api_session_filter) != 1:
+            raise Exception("1 session filter should have been registered."
+                            f"{len(api_session_filter)} were registered.")
+        accepted_key = api_session_filter[0]
+        if accepted_key != self._api_credentials\
+                .api_key:
+            raise Exception("The whitelisted api session key does not "
+                            "match our session key.")
+        return False
+
+    def _on_initial(self, response):
+        # Create a new order record for the initial response.
+        order_response = OrderResponse.from_json_dict(response)
+        new_order = exchanges.Order()
+        order_response.update_order(new_order)
+        if new_order.order_id in self._orders:
+            raise Exception("An initial response was received for an "
+                            "existing order (id: {new_order.order_id}).")
+        self._orders[new_order.order_id] = new_order
+        return True
+
+    def _on_accepted(self, response):
+        # Create a new order. Mark the corresponding action as successful.
+        order_response = OrderResponse.from_json_dict(response)
+        new_order = exchanges.Order()
+        order_response.update_order(new_order)
+        self._orders[new_order.order_id] = new_order
+        action = self._create_actions.get(int(order_response.client_order_id))
+        if action is None:
+            raise Exception("Received an order accept message, but no "
+                            "matching order action was found.")
+        if action.order is not None:
+            raise Exception("An order accept message was received, "
+                            "but its corresponding action already "
+                            "has an order (id:{a.order.order_id}).")
+        action.order = new_order
+        # I don't know if we need this status.
+        action.status = exchanges.Action.Status.SUCCESS
+        return True
+
+    def _on_rejected(self, response):
+        order_response = OrderResponse.from_json_dict(response)
+        log.warning(f"An order was rejected. Reason: " + response['reason'])
+        new_order = exchanges.Order()
+        order_response.update_order(new_order)
+        self._orders[new_order.order_id] = new_order
+        action = self._create_actions.get(int(order_response.client_order_id))
+        if action is None:
+            raise Exception("Received an order reject message, but no "
+                            "matching order action was found.")
+        if action.order is not None:
+            raise Exception("An order reject message was received, "
+                            "but its corresponding action already "
+                            "has an order (id:{a.order.order_id}).")
+        action.order = new_order
+        action.status = exchanges.Action.Status.FAILED
+        return True
+
+    def _on_booked(self, response):
+        # I don't think we need to act on this.
+        log.info("Order booked. Order id:{response['order_id']}.")
+        return False
+
+    def _on_fill(self, response):
+        order_response = OrderResponse.from_json_dict(response)
+        order = self._orders.get(order_response.order_id)
+        if not order:
+            raise Exception("Received a fill response for an unknown order "
+                            f"(id:{order_response.order_id}).")
+        log.info("Order fill response received for order id: "
+                 f"{order_response.order_id}.")
+        order_response.update_order(order)
+        # TODO: we could add some checks here to see if our fee calculation
+        # is correct.
+        return True
+
+    def _on_cancelled(self, response):
+        order_response = OrderResponse.from_json_dict(response)
+        order = self._orders.get(order_response.order_id)
+        reason = response.get('reason', 'No reason provided.')
+        # Unused:
+        # cancel_command_id = response.get('cancel_command_id', None)
+        if not order:
+            raise Exception("Received a cancelled response for an unknown "
+                            f"order (id:{order_response.order_id}). Reason:"
+                            f"{reason}")
+        log.info("Order fill response received for order id: "
+                 f"{order_response.order_id}. Reason: {reason}")
+        cancel_action = self._cancel_actions.get(order_response.order_id,
+                                                 None)
+        if not cancel_action:
+            raise Exception("Received a cancel response but can't find a "
+                            "matching cancel action.")
+        cancel_action.status = exchanges.Action.Status.SUCCESS
+        return True
+
+    def _on_cancel_rejected(self, response):
+        order_response = OrderResponse.from_json_dict(response)
+        reason = response.get('reason', 'No reason provided.')
+        log.warning("Failed to cancel order (id: "
+                    f"{order_response.order_id}). Reason: {reason}")
+        cancel_action = self._cancel_actions.get(order_response.order_id,
+                                                 None)
+        if not cancel_action:
+            raise Exception("Received a cancel rejected response but can't "
+                            "find a matching cancel action.")
+        cancel_action.status = exchanges.Action.Status.FAILED
+        return True
+
+    def _on_closed(self, response):
+        order_response = OrderResponse.from_json_dict(response)
+        order = self._orders.get(order_response.order_id)
+        if not order:
+            raise Exception("Received a close response for an unknown order"
+                            f" (id:{order_response.order_id}).")
+        log.info("Order close response received for order id: "
+                 f"{order_response.order_id}.")
+        order_response.update_order(order)
+        return True
+
+    # Maps the 'type' of an /order/events response to the method handling it.
+    # The values are plain functions here (the class doesn't exist yet), so
+    # _handle_orders calls them with self explicitly.
+    _ORDER_RESPONSE_HANDLERS = {
+        'subscription_ack': _on_subscription_ack,
+        'initial': _on_initial,
+        'accepted': _on_accepted,
+        'rejected': _on_rejected,
+        'booked': _on_booked,
+        'fill': _on_fill,
+        'cancelled': _on_cancelled,
+        'cancel_rejected': _on_cancel_rejected,
+        'closed': _on_closed,
+    }
 
     def execute_action(self, action):
         """Ren the given action on this exchange."""
@@ -681,7 +779,7 @@ class GeminiExchange(ExchangeClient):
                                         f"'{action.exchange}' was given to "
                                         f"GeminiExchange.")
         if type(action) == exchanges.CreateOrder:
-            self._create_actions.append(action)
+            self._create_actions[id(action)] = action
             new_order_path = "/v1/order/new"
             params = self._new_order_parameters(action)
             self._post_http_request(new_order_path, params)
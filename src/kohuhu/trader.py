@@ -38,17 +38,18 @@ class Timer:
         self.tasks.append(timer_task)
 
     async def _do_every(self, period, f):
-        def tick():
-            init_time = datetime.now()
-            count = 0
-            while True:
-                count += 1
-                target_time = init_time + count*period
-                diff = target_time - datetime.now()
-                yield max(diff, timedelta(seconds=0))
-        ticker = tick()
-        for delta in tick():
-            await asyncio.sleep(delta.seconds)
+        # The period is converted to seconds once up front; the per-tick
+        # arithmetic is then plain float maths on the loop's monotonic clock,
+        # instead of allocating datetime/timedelta objects every tick.
+        loop = asyncio.get_event_loop()
+        period_seconds = period.total_seconds()
+        init_time = loop.time()
+        count = 0
+        while True:
+            count += 1
+            target_time = init_time + count * period_seconds
+            delay = max(target_time - loop.time(), 0)
+            await asyncio.sleep(delay)
             # await f() ?
             f(datetime.now())
 
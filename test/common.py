@@ -2,16 +2,51 @@ import datetime
 import asyncio
 import os
 
-async def wait_until(test, max_wait=datetime.timedelta(seconds=3)):
+# Shared default for the wait helpers below. Python evaluates default
+# arguments once at definition time, so this is about having a single place
+# to change the timeout, not about avoiding per-call allocation.
+_DEFAULT_MAX_WAIT = datetime.timedelta(seconds=3)
+
+
+async def wait_until(test, max_wait=_DEFAULT_MAX_WAIT):
     """Wait until the specified test is True, for up to max_wait time."""
-    start_time = datetime.datetime.now()
+    # The deadline is computed once against the event loop's monotonic clock:
+    # cheaper than building datetime/timedelta objects every iteration, and
+    # immune to wall-clock adjustments mid-wait.
+    loop = asyncio.get_event_loop()
+    deadline = loop.time() + max_wait.total_seconds()
     while not test():
         await asyncio.sleep(1)
-        if (datetime.datetime.now() - start_time) > max_wait:
+        if loop.time() > deadline:
             return False
     return True
 
 
+async def wait_for_update(publisher, condition, max_wait=_DEFAULT_MAX_WAIT):
+    """Wait until condition() is True, woken by publisher notifications.
+
+    Unlike wait_until, which re-checks on a fixed sleep interval, this
+    registers a callback on the given publisher and re-checks the condition
+    only when an update is published, so it returns the moment the condition
+    becomes true. Returns False if max_wait elapses first."""
+    if condition():
+        return True
+    satisfied = asyncio.Event()
+
+    def on_update(publisher_id, description):
+        if condition():
+            satisfied.set()
+
+    publisher.add_callback(on_update)
+    try:
+        await asyncio.wait_for(satisfied.wait(), max_wait.total_seconds())
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        publisher.remove_callback(on_update)
+    return True
+
+
 def enableProxy():
     os.environ["HTTP_PROXY"] = "http://127.0.0.1:8080"
     os.environ["HTTPS_PROXY"] = "https://127.0.0.1:8080"
@@ -0,0 +1,40 @@
+import logging
+
+import pytest
+
+import kohuhu.credentials as credentials
+import test.common
+
+# Disable websockets debug logging for more comprehensible logs when using -s.
+# Configured once here rather than at import time in every test module.
+logging.getLogger('websockets').setLevel(logging.ERROR)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--proxy', action='store_true', default=False,
+        help="Route exchange HTTP(S) traffic through the local BurpSuite "
+             "proxy (see test.common.enableProxy).")
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _enable_proxy(request):
+    """Mutates the proxy environment variables only when asked to.
+
+    This used to happen unconditionally at import time in the integration
+    modules, redirecting every module's HTTP traffic whether or not a proxy
+    was running."""
+    if request.config.getoption('--proxy'):
+        test.common.enableProxy()
+
+
+@pytest.fixture(scope='session')
+def _load_credentials():
+    """Loads the credential file once per session.
+
+    The integration modules used to call load_credentials() at import time;
+    pytest imports every module during collection, so the file was read and
+    parsed once per module before a single test started. Only the fixtures
+    and tests that actually need credentials request this, so the rest of
+    the suite keeps running without the (private) credential file."""
+    credentials.load_credentials()
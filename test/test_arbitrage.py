@@ -105,9 +105,9 @@ def exch_2_order_book_data(empty_data):
     td = empty_data
     # Initialize the order book of the exchange to sell on.
     td.exch_2_state.order_book().set_bids_remaining(at_price=Decimal(20000),
-                                                    remaining=Decimal(5.0))
+                                                    remaining=Decimal("5.0"))
     td.exch_2_state.order_book().set_bids_remaining(at_price=Decimal(1600),
-                                                    remaining=Decimal(5.0))
+                                                    remaining=Decimal("5.0"))
     # Give us lots of money so that balance isn't an issue by default.
     one_million = Decimal(1000000)
     td.exch_1_state.balance().set_free("USD", one_million)
@@ -225,7 +225,7 @@ def test_bid_is_balance_aware(exch_2_order_book_data):
     exch_2_market_price = td.exch_2_state.order_book().bid_prices()[0]
     bid_price_estimate = small_balance / exch_2_market_price
     # Accounting for our profit target and any fee buffer.
-    arbitary_buffer = Decimal(0.05)  # Make smaller to make the test stricter.
+    arbitary_buffer = Decimal("0.05")  # Make smaller to make the test stricter.
     bid_price_estimate = bid_price_estimate * (Decimal(1) - td.profit_target -
                                                arbitary_buffer)
     max_can_afford = exch_2_market_price / bid_price_estimate
@@ -393,7 +393,7 @@ def test_update_bid_price(state_after_one_bid_order):
     td.exch_2_state.order_book().set_bids_remaining(at_price=Decimal(20000),
                                                     remaining=Decimal(0))
     td.exch_2_state.order_book().set_bids_remaining(at_price=Decimal(19950),
-                                                    remaining=Decimal(5.0))
+                                                    remaining=Decimal("5.0"))
     actions = td.step_algorithm()
     assert not len(actions)
 
@@ -401,7 +401,7 @@ def test_update_bid_price(state_after_one_bid_order):
     td.exch_2_state.order_book().set_bids_remaining(at_price=Decimal(19950),
                                                     remaining=Decimal(0))
     td.exch_2_state.order_book().set_bids_remaining(at_price=Decimal(17000),
-                                                    remaining=Decimal(5.0))
+                                                    remaining=Decimal("5.0"))
     # The first action should be a cancel action.
     actions = td.step_algorithm()
     assert len(actions) == 1
@@ -5,9 +5,9 @@ def test_sorted_quotes_bids():
     """Test that the SortedQuotes data structure correctly orders bid quotes"""
     # -- Setup --
     bids = SortedQuotes(Side.BID)
-    bid_high = Quote(price=Decimal(10000), quantity=Decimal(3.14))
+    bid_high = Quote(price=Decimal(10000), quantity=Decimal("3.14"))
     bid_medium = Quote(price=Decimal(800), quantity=Decimal(7))
-    bid_low = Quote(price=Decimal(200.2), quantity=Decimal(5))
+    bid_low = Quote(price=Decimal("200.2"), quantity=Decimal(5))
 
     # -- Action --
     bids.set_quote(bid_medium)
@@ -34,9 +34,9 @@ def test_sorted_quotes_asks():
     """Test that the SortedQuotes data structure correctly orders ask quotes"""
     # -- Setup --
     asks = SortedQuotes(Side.ASK)
-    ask_high = Quote(price=Decimal(10000), quantity=Decimal(3.14))
+    ask_high = Quote(price=Decimal(10000), quantity=Decimal("3.14"))
     ask_medium = Quote(price=Decimal(800), quantity=Decimal(7))
-    ask_low = Quote(price=Decimal(200.2), quantity=Decimal(5))
+    ask_low = Quote(price=Decimal("200.2"), quantity=Decimal(5))
 
     # -- Action --
     asks.set_quote(ask_medium)
@@ -13,45 +13,32 @@ pytestmark = pytest.mark.skipif(True,
 def load_creds():
     credentials.load_credentials()
 
-def test_fee_as_factor():
-    # Setup
-    transaction_size = Decimal(100)
-    fee = Decimal(0.01)
-
-    # Test
-    # A percentage fee of 1% on a transaction of 100 should result in a total
-    # fee of 0.990099 (6sf) being charged, leaving the the transaction with a
-    # value of 99.0099 (6sf). Thus, the fee factor of a 1% fee is 99.0099 (6sf).
-    #
-    # Another perspective: 99.0099 (6sf) * (1.00 + 0.01 fee) = 100.
-    #
+# The two fee conversion tests share the same shape, so they are parametrized
+# into a single test.
+#
+# fee_as_factor: a percentage fee of 1% on a transaction of 100 should result
+# in a total fee of 0.990099 (6sf) being charged, leaving the the transaction
+# with a value of 99.0099 (6sf). Thus, the fee factor of a 1% fee is
+# 99.0099 (6sf). Another perspective: 99.0099 (6sf) * (1.00 + 0.01 fee) = 100.
+#
+# fee_as_percentage: a fee factor of 0.9 on a transaction of 100 means that a
+# 10 unit fee will be charged leaving 90 units remaining. As a percentage of
+# the final transaction value (90), the fee percentage is
+# 10/90 = 1/9 = 0.1111 (4dp).
+@pytest.mark.parametrize("convert,fee_input,expected", [
+    (exchanges_old.fee_as_factor, Decimal("0.01"),
+     Decimal(1) / Decimal("1.01")),
+    (exchanges_old.fee_as_percentage, Decimal("0.9"), Decimal(1) / Decimal(9)),
+])
+def test_fee_conversion(convert, fee_input, expected):
+    converted = convert(fee_input)
     # We use the context here to make it easy to compare the two decimals at
     # a precision. Alternatively, we could just use quantize instead.
-    factor = exchanges_old.fee_as_factor(fee)
-    expected_factor = Decimal(1) / Decimal(1.01)
     with decimal.localcontext(decimal.BasicContext):
         # Round the decimals to the precision of this context.
-        factor = +factor
-        expected_factor = +expected_factor
-        assert factor == expected_factor
-
-
-def test_fee_as_percentage():
-    # Setup
-    transaction_size = Decimal(100)
-    fee_factor = Decimal(0.9)
-
-    # Test
-    # A fee factor of 0.9 on a transaction of 100 means that a 10 unit fee will
-    # be charged leaving 90 units remaining. As a percentage of the final
-    # transaction value (90), the fee percentage is 10/90 = 1/9 = 0.1111 (4dp).
-    fee = exchanges_old.fee_as_percentage(fee_factor)
-    expected_fee = Decimal(1) / Decimal(9)
-    with decimal.localcontext(decimal.BasicContext):
-        # Round the decimals to the precision of this context.
-        fee = +fee
-        expected_fee = +expected_fee
-        assert fee == expected_fee
+        converted = +converted
+        expected = +expected
+        assert converted == expected
 
 
 def test_fees():
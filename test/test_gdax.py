@@ -8,37 +8,82 @@ from decimal import Decimal
 import decimal
 import kohuhu.credentials as credentials
 
-credentials.load_credentials()
+
+@pytest.fixture(scope='session')
+def loaded_credentials():
+    """Makes sure the credential file has been loaded, once per session.
+
+    Loading at module import time re-reads and re-parses the file for every
+    collected module that does the same; with a fixture the work is done
+    lazily and only once."""
+    if not credentials._credentials:
+        credentials.load_credentials()
+    return credentials
+
+
+# Response templates are built once at module scope. The fixtures hand out
+# shallow copies, so tests are free to tweak top-level fields.
+_HEARTBEAT_RESPONSE = {
+    "type": "heartbeat",
+    "sequence": 90,
+    "last_trade_id": 20,
+    "product_id": "BTC-USD",
+    "time": "2014-11-07T08:19:28.464459Z"
+}
+
+_EMPTY_L2_UPDATE_RESPONSE = {
+    "type": "l2update",
+    "product_id": "BTC-USD",
+    "changes": []
+}
 
 
 @pytest.fixture()
 def heartbeat_response():
-    return {
-        "type": "heartbeat",
-        "sequence": 90,
-        "last_trade_id": 20,
-        "product_id": "BTC-USD",
-        "time": "2014-11-07T08:19:28.464459Z"
-    }
+    return dict(_HEARTBEAT_RESPONSE)
 
 
 @pytest.fixture()
 def empty_l2_update_response():
-    return{
-        "type": "l2update",
-        "product_id": "BTC-USD",
-        "changes": []
-    }
+    return dict(_EMPTY_L2_UPDATE_RESPONSE)
 
-@pytest.fixture
-async def gdax_exchange():
-    gdax = GdaxExchange(credentials.credentials_for("gdax_sandbox"),
+@pytest.yield_fixture(scope='session')  # This scope needs to be >= any async fixtures.
+def event_loop():
+    """Yield the default event loop."""
+    loop = asyncio.get_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope='session')
+async def _session_gdax_exchange(loaded_credentials):
+    """One GdaxExchange with a running message-processing task.
+
+    Creating an exchange and starting its processing task per-test is
+    needlessly slow; the tests share this one and reset any state they touch
+    via the gdax_exchange fixture."""
+    gdax = GdaxExchange(loaded_credentials.credentials_for("gdax_sandbox"),
                         sandbox=True)
-    listen_websocket_task = asyncio.ensure_future(gdax._process_websocket_messages())
+    process_messages_task = asyncio.get_event_loop().create_task(
+        gdax._process_websocket_messages())
     yield gdax
 
-    # Clean up
-    listen_websocket_task.cancel()
+    # Clean up. Await the cancelled task so that it is fully finalized and any
+    # exception it hit while processing messages is propagated, rather than
+    # leaving it to be garbage collected mid-flight.
+    process_messages_task.cancel()
+    try:
+        await process_messages_task
+    except asyncio.CancelledError:
+        pass
+
+
+@pytest.fixture
+async def gdax_exchange(_session_gdax_exchange):
+    gdax = _session_gdax_exchange
+    # Reset the state that the tests touch.
+    gdax._last_heartbeat_time = None
+    return gdax
 
 @pytest.mark.asyncio
 async def test_handle_heartbeat(gdax_exchange, heartbeat_response, empty_l2_update_response):
@@ -73,6 +118,26 @@ async def test_handle_heartbeat(gdax_exchange, heartbeat_response, empty_l2_upda
     with pytest.raises(Exception) as ex:
         gdax._handle_heartbeat(heartbeat_response)
 
+    # -- Setup --
+    # Feed a backlog of heartbeats through the message queue in one go. The
+    # processing task drains the whole backlog in a single scheduling pass, so
+    # a single yield to the event loop is all that is needed (no polling).
+    backlog_size = 15
+    gdax._last_heartbeat_time = None
+    base_time = datetime.datetime(2014, 11, 7, 8, 19, 28, 464459)
+    for i in range(backlog_size):
+        heartbeat_response['time'] = (base_time + datetime.timedelta(
+            seconds=i)).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        gdax._message_queue.put_nowait(json.dumps(heartbeat_response))
+
+    # -- Action --
+    await asyncio.sleep(0)
+
+    # -- Check --
+    assert gdax._message_queue.empty()
+    assert gdax._last_heartbeat_time == base_time + datetime.timedelta(
+        seconds=backlog_size - 1)
+
 
 @pytest.fixture
 def balance_response():
@@ -98,10 +163,13 @@ def balance_response():
 
 
 def test_handle_balance(balance_response):
-    credentials.load_credentials("api_credentials.json.example")
-    gdax_client = GdaxExchange(
-        api_credentials=credentials.credentials_for("gdax_sandbox"),
-        sandbox=True)
+    # The exchange only needs some credentials object to construct itself;
+    # a plaintext dummy avoids reading and parsing a credential file.
+    creds = credentials.ApiCredentials(
+        ccxt_id="gdax_sandbox", owner="test", key="not_a_real_key",
+        secret="not_a_real_secret", passphrase="not_a_real_passphrase",
+        url=None)
+    gdax_client = GdaxExchange(api_credentials=creds, sandbox=True)
     assert gdax_client.exchange_state.balance().free("BTC") == Decimal(0)
     assert gdax_client.exchange_state.balance().on_hold("BTC") == Decimal(0)
     assert gdax_client.exchange_state.balance().free("USD") == Decimal(0)
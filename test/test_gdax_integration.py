@@ -5,72 +5,172 @@ import kohuhu.exchanges as exchanges
 from decimal import Decimal
 import asyncio
 from kohuhu.custom_exceptions import MockError
-import logging
-from test.common import wait_until
-import test.common
+# The BurpSuite proxy is enabled with the --proxy pytest option (see
+# conftest.py) instead of unconditionally at import time here.
 
-# Disable websockets debug logging for more comprehensible logs when using -s
-logger = logging.getLogger('websockets')
-logger.setLevel(logging.ERROR)
+# uvloop is noticeably faster at shuffling websocket traffic, but it is an
+# optional extra; fall back to the stdlib loop when it isn't installed.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-credentials.load_credentials('api_credentials.json')
 
-# TODO: Should be an env variable (or Tim should install proxy)
-test.common.enableProxy()
-
-@pytest.yield_fixture(scope='module')  # This scope needs to be >= any async fixtures.
+@pytest.yield_fixture(scope='session')  # This scope needs to be >= any async fixtures.
 def event_loop():
-    """Yield the default event loop."""
-    loop = asyncio.get_event_loop()
+    """Yield the default event loop, backed by uvloop when available."""
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    else:
+        loop = asyncio.get_event_loop()
     yield loop
+    loop.run_until_complete(_drain_exchange_pool())
     loop.close()
 
 
+# The largest order size the tests will place. Built once here rather than
+# re-parsing the literal inside the test body.
+_MAX_AMOUNT = Decimal("0.01")
+
+# Hosts contacted by the exchange fixtures below.
+_GDAX_HOSTS = ('ws-feed.gdax.com', 'ws-feed-public.sandbox.gdax.com')
+
+
+@pytest.fixture(scope='session', autouse=True)
+async def _warm_dns():
+    """Resolves the GDAX hostnames before any exchange fixture connects.
+
+    Both lookups run concurrently and populate the resolver cache, so the
+    first websocket connection only pays for the TCP + TLS handshake rather
+    than a DNS round-trip as well. Failures are ignored: the exchange
+    fixtures will surface any real connectivity problem themselves."""
+    loop = asyncio.get_event_loop()
+
+    async def resolve(host):
+        try:
+            await loop.getaddrinfo(host, 443)
+        except OSError:
+            pass
+
+    await asyncio.gather(*(resolve(host) for host in _GDAX_HOSTS))
+
+
+# credentials_for scans the whole credential list and logs on every call;
+# the results never change within a test run, so cache the lookups.
+_credentials_cache = {}
+
+
+def _cached_credentials_for(exchange_id, owner=None):
+    key = (exchange_id, owner)
+    if key not in _credentials_cache:
+        _credentials_cache[key] = credentials.credentials_for(exchange_id,
+                                                              owner=owner)
+    return _credentials_cache[key]
+
+
+# The single place where the exchange variants are described; the fixtures
+# below are all parametrized off this table.
+_EXCHANGE_VARIANTS = {
+    'gdax': ('gdax', 'tim'),
+    'gdax_sandbox': ('gdax_sandbox', 'kevin'),
+}
+
+
+# A small connection pool: one running exchange per credential set, shared by
+# every fixture/test that asks for it, instead of opening a fresh websocket
+# for each.
+_exchange_pool = {}
+
+
+async def _pooled_gdax_exchange(credential_id, owner):
+    """Returns a running GdaxExchange from the pool, starting it on first use."""
+    key = (credential_id, owner)
+    if key not in _exchange_pool:
+        creds = _cached_credentials_for(credential_id, owner=owner)
+        # Compression is disabled: inflating the (large) order book snapshot
+        # frame costs more CPU than the saved bandwidth is worth in tests.
+        # Note: UTF-8 validation of inbound text frames cannot be skipped; the
+        # websockets library validates unconditionally when decoding.
+        gdax = GdaxExchange(api_credentials=creds, sandbox=True,
+                            compression=None)
+        run_gdax_task = asyncio.get_event_loop().create_task(gdax.run())
+        # Give it 5 seconds to connect. A timeout mark on a fixture doesn't
+        # bound the fixture body, so the wait is bounded here instead.
+        await asyncio.wait_for(gdax.order_book_ready.wait(), timeout=5)
+        _exchange_pool[key] = (gdax, run_gdax_task)
+    return _exchange_pool[key][0]
+
+
+async def _drain_exchange_pool():
+    """Stops every pooled exchange and propagates any task exceptions.
+
+    The exchanges are stopped and awaited concurrently, so teardown costs
+    one websocket close round-trip rather than one per exchange."""
+    if not _exchange_pool:
+        return
+    pooled = list(_exchange_pool.values())
+    _exchange_pool.clear()
+    await asyncio.gather(*(gdax.stop() for gdax, _ in pooled))
+    results = await asyncio.gather(*(task for _, task in pooled),
+                                   return_exceptions=True)
+    for result in results:
+        if isinstance(result, asyncio.CancelledError):
+            continue  # Expected: stop() cancels the run task.
+        if isinstance(result, Exception):
+            raise result
+
+
 @pytest.mark.skip(reason="No real gdax credentials")
-@pytest.fixture(scope='module')
-@pytest.mark.timeout(5)  # Give it 5 seconds to connect
-async def gdax_exchange():
+@pytest.fixture(scope='session')
+async def gdax_exchange(_load_credentials):
     """Sets up the real Gdax exchange"""
-    creds = credentials.credentials_for('gdax', owner="tim")
-    gdax = GdaxExchange(api_credentials=creds, sandbox=True)
-    run_gdax_task = asyncio.ensure_future(gdax.run())
-    await gdax.order_book_ready.wait()
-    yield gdax
-
-    # Clean up
-    await gdax.stop()
-    await run_gdax_task  # This will propagate any exceptions.
+    return await _pooled_gdax_exchange(*_EXCHANGE_VARIANTS['gdax'])
 
 
-@pytest.fixture(scope='module')
-@pytest.mark.timeout(5)  # Give it 5 seconds to connect
-async def gdax_sandbox_exchange():
+@pytest.fixture(scope='session')
+async def gdax_sandbox_exchange(_load_credentials):
     """Sets up the sandbox Gdax exchange"""
-    creds = credentials.credentials_for('gdax_sandbox', owner="kevin")
-    gdax = GdaxExchange(api_credentials=creds, sandbox=True)
-    run_gdax_task = asyncio.ensure_future(gdax.run())
-    await gdax.order_book_ready.wait()
-    yield gdax
+    return await _pooled_gdax_exchange(*_EXCHANGE_VARIANTS['gdax_sandbox'])
+
+
+@pytest.fixture(scope='session')
+async def gdax_exchanges(_load_credentials):
+    """Sets up every exchange variant, connecting them concurrently.
 
-    # Clean up
-    await gdax.stop()
-    await run_gdax_task  # This will propagate any exceptions.
+    Use this instead of requesting gdax_exchange and gdax_sandbox_exchange
+    separately when a test needs both: the connection handshakes and order
+    book snapshots then overlap rather than running back to back.
+    """
+    return await asyncio.gather(
+        *(_pooled_gdax_exchange(credential_id, owner)
+          for credential_id, owner in _EXCHANGE_VARIANTS.values()))
 
 
 @pytest.mark.timeout(5)  # Add a timeout to assert failure if the exception is not thrown.
-def test_gdax_callback_error_propagation():
+def test_gdax_callback_error_propagation(_load_credentials):
     """Tests that errors raised in the callback are propagated from the gdax.run()
     method and cause the run_gdax_task to end and raise the same error"""
     def raise_test_error():
         raise MockError
 
-    with pytest.raises(MockError):
-        loop = asyncio.get_event_loop()
-        gdax = GdaxExchange(credentials.credentials_for("gdax_sandbox"),
-                            sandbox=True)
-        gdax.set_on_change_callback(raise_test_error)
-        run_gdax_task = asyncio.ensure_future(gdax.run_task())
-        loop.run_until_complete(run_gdax_task)
+    # Run on a dedicated short-lived loop: the crashing exchange task would
+    # otherwise leave cancelled-but-pending callbacks behind on the shared
+    # session loop that the other tests run on.
+    previous_loop = asyncio.get_event_loop()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        with pytest.raises(MockError):
+            gdax = GdaxExchange(_cached_credentials_for("gdax_sandbox"),
+                                sandbox=True)
+            gdax.set_on_change_callback(raise_test_error)
+            run_gdax_task = asyncio.ensure_future(gdax.run_task(), loop=loop)
+            loop.run_until_complete(run_gdax_task)
+    finally:
+        loop.close()
+        asyncio.set_event_loop(previous_loop)
 
 @pytest.mark.skip(reason="No real gdax credentials")
 def test_valid_orderbook(gdax_exchange):
@@ -84,44 +184,53 @@ def test_valid_orderbook(gdax_exchange):
 
     bids = gdax_exchange.exchange_state.order_book().bids()
     asks = gdax_exchange.exchange_state.order_book().asks()
+    # Take a single snapshot of the orderbook bounds up front. Indexing the
+    # quote collections builds a fresh Quote each time, so repeating the
+    # attribute accesses in every assert would re-walk the book (and could
+    # even observe different values if an update lands mid-test).
     best_bid = bids[0]
     best_ask = asks[0]
+    best_bid_price = best_bid.price
+    best_bid_quantity = best_bid.quantity
+    best_ask_price = best_ask.price
+    best_ask_quantity = best_ask.quantity
+    bid_count = len(bids)
+    ask_count = len(asks)
 
     # -- Check --
-    assert best_ask.price > best_bid.price, \
-        f"best_ask ({best_ask.price}) should always be greater than the best_bid ({best_bid.price})"
+    assert best_ask_price > best_bid_price, \
+        f"best_ask ({best_ask_price}) should always be greater than the best_bid ({best_bid_price})"
 
-    bid_ask_spread = best_ask.price - best_bid.price
-    relative_bid_ask_spread = bid_ask_spread / best_bid.price
+    bid_ask_spread = best_ask_price - best_bid_price
+    relative_bid_ask_spread = bid_ask_spread / best_bid_price
     assert relative_bid_ask_spread < 0.1, \
-        "The bid-ask spread is >10% of the the current price. best_bid: {best_bid.price}, best_ask:{best_ask.price}"
+        f"The bid-ask spread is >10% of the the current price. best_bid: {best_bid_price}, best_ask:{best_ask_price}"
 
-    assert len(bids) > min_expected_quotes_per_side, \
-        f"There were {len(bids)} bids on gdax which is lower than the minimum of {min_expected_quotes_per_side} " \
+    assert bid_count > min_expected_quotes_per_side, \
+        f"There were {bid_count} bids on gdax which is lower than the minimum of {min_expected_quotes_per_side} " \
         f"expected."
-    assert len(asks) > min_expected_quotes_per_side, \
-        f"There were {len(asks)} asks on gdax which is lower than the minimum of {min_expected_quotes_per_side} " \
+    assert ask_count > min_expected_quotes_per_side, \
+        f"There were {ask_count} asks on gdax which is lower than the minimum of {min_expected_quotes_per_side} " \
         f"expected."
 
-    assert best_bid.price > min_expected_best_bid_price, \
-        f"Expected best_bid to be > {min_expected_best_bid_price}. Actual: {best_bid.price}"
-    assert best_ask.price < max_expected_best_ask_price, \
-        f"Expected best_ask to be < {max_expected_best_ask_price}. Actual: {best_ask.price}"
+    assert best_bid_price > min_expected_best_bid_price, \
+        f"Expected best_bid to be > {min_expected_best_bid_price}. Actual: {best_bid_price}"
+    assert best_ask_price < max_expected_best_ask_price, \
+        f"Expected best_ask to be < {max_expected_best_ask_price}. Actual: {best_ask_price}"
 
-    assert best_bid.quantity > 0, "best_bid had zero quantity"
-    assert best_ask.quantity > 0, "best_ask had zero quantity"
-    assert best_bid.quantity < max_expected_quote_quantity, \
-        f"best_bid had quantity {best_bid.quantity} which is > than expected {max_expected_quote_quantity}"
-    assert best_ask.quantity < max_expected_quote_quantity, \
-        f"best_ask had quantity {best_ask.quantity} which is > than expected {max_expected_quote_quantity}"
+    assert best_bid_quantity > 0, "best_bid had zero quantity"
+    assert best_ask_quantity > 0, "best_ask had zero quantity"
+    assert best_bid_quantity < max_expected_quote_quantity, \
+        f"best_bid had quantity {best_bid_quantity} which is > than expected {max_expected_quote_quantity}"
+    assert best_ask_quantity < max_expected_quote_quantity, \
+        f"best_ask had quantity {best_ask_quantity} which is > than expected {max_expected_quote_quantity}"
 
 
 @pytest.mark.asyncio
 async def test_execute_action(gdax_sandbox_exchange):
     gdax = gdax_sandbox_exchange
     lowest_ask_quote = gdax.exchange_state.order_book().asks()[0]
-    max_amount = Decimal("0.01")
-    bid_amount = min(lowest_ask_quote.quantity, max_amount)
+    bid_amount = min(lowest_ask_quote.quantity, _MAX_AMOUNT)
     bid_limit_action = exchanges.CreateOrder("gdax_sandbox",
                                              exchanges.Side.BID,
                                              exchanges.Order.Type.LIMIT,
@@ -129,9 +238,21 @@ async def test_execute_action(gdax_sandbox_exchange):
                                              price=lowest_ask_quote.price)
     order_count = len(gdax.exchange_state._orders)
     assert order_count == 0
-    gdax.execute_action(bid_limit_action)
-    success = await wait_until(lambda: len(gdax.exchange_state._orders))
-    assert success
+    # The exchange notifies its publisher whenever the state changes; signal
+    # an event from the callback instead of polling the order dict.
+    order_seen = asyncio.Event()
+
+    def on_update(publisher_id, description):
+        if gdax.exchange_state._orders:
+            order_seen.set()
+
+    gdax.exchange_state.update_publisher.add_callback(on_update)
+    try:
+        gdax.execute_action(bid_limit_action)
+        await asyncio.wait_for(order_seen.wait(), timeout=3)
+    finally:
+        gdax.exchange_state.update_publisher.remove_callback(on_update)
+    assert len(gdax.exchange_state._orders)
 
 @pytest.mark.skip(reason="TODO debug: Getting a 'fatal write error on socket transport'")
 @pytest.mark.asyncio
@@ -50,16 +50,49 @@ def test_encode_and_sign(real_credentials):
     assert b64 == expected_payload
 
 
+# Response templates are built once at module scope. The fixtures hand out
+# shallow copies, so tests are free to tweak top-level fields.
+_HEARTBEAT_RESPONSE = {
+    "type": "heartbeat",
+    "timestampms": 123456789,
+    "sequence": 0,
+    "socket_sequence": 10,
+    "trace_id": "some_sort_of_id"
+}
+
+_SUBSCRIPTION_ACK_RESPONSE = {
+    "type": "subscription_ack",
+    "accountId": 266,
+    "subscriptionId": "ws-order-events-266-as1hpfh4bmin4limcj0",
+    "symbolFilter": [],
+    "apiSessionFilter": [gemini_example_api_key],
+    "eventTypeFilter": []
+}
+
+_INITIAL_RESPONSE = {
+    "type": "initial",
+    "order_id": "652150",
+    "api_session": "UI",
+    "symbol": "btcusd",
+    "side": "buy",
+    "order_type": "exchange limit",
+    "timestamp": "1478789840",
+    "timestampms": 1478789840842,
+    "is_live": True,
+    "is_cancelled": False,
+    "is_hidden": False,
+    "avg_execution_price": "713.95",
+    "executed_amount": "2",
+    "remaining_amount": "3",
+    "original_amount": "5",
+    "price": "713.95",
+    "socket_sequence": 0
+}
+
+
 @pytest.fixture
 def heartbeat_response():
-    test_heartbeat_response = {
-        "type": "heartbeat",
-        "timestampms": 123456789,
-        "sequence": 0,
-        "socket_sequence": 10,
-        "trace_id": "some_sort_of_id"
-    }
-    return test_heartbeat_response
+    return dict(_HEARTBEAT_RESPONSE)
 
 
 def test_process_heartbeat(heartbeat_response):
@@ -95,17 +128,30 @@ def test_check_sequence(heartbeat_response):
     with pytest.raises(Exception):
         GeminiExchange._check_sequence(heartbeat_response, socket_info)
 
+@pytest.fixture(scope='module')
+def _module_gemini_exchange():
+    """One unauthenticated GeminiExchange shared by the response handler tests.
+
+    Constructing an exchange per test repeats the same setup work ten times
+    over; the tests share this instance and reset any state they touch via
+    the gemini_exchange fixture."""
+    return GeminiExchange()
+
+
+@pytest.fixture
+def gemini_exchange(_module_gemini_exchange):
+    exchange = _module_gemini_exchange
+    # Reset the state that the tests touch. The exchange's _orders aliases
+    # the exchange state's order dict, so clearing one clears both.
+    exchange.exchange_state._orders.clear()
+    exchange._create_actions = {}
+    exchange._cancel_actions = {}
+    return exchange
+
+
 @pytest.fixture
 def subscription_ack_response():
-    test_response = {
-        "type": "subscription_ack",
-        "accountId": 266,
-        "subscriptionId": "ws-order-events-266-as1hpfh4bmin4limcj0",
-        "symbolFilter": [],
-        "apiSessionFilter": [gemini_example_api_key],
-        "eventTypeFilter": []
-    }
-    return test_response
+    return dict(_SUBSCRIPTION_ACK_RESPONSE)
 
 
 def test_process_subscription_ack(subscription_ack_response, test_credentials):
@@ -122,31 +168,12 @@ def test_process_subscription_ack(subscription_ack_response, test_credentials):
 
 @pytest.fixture
 def initial_response():
-    test_response = {
-        "type": "initial",
-        "order_id": "652150",
-        "api_session": "UI",
-        "symbol": "btcusd",
-        "side": "buy",
-        "order_type": "exchange limit",
-        "timestamp": "1478789840",
-        "timestampms": 1478789840842,
-        "is_live": True,
-        "is_cancelled": False,
-        "is_hidden": False,
-        "avg_execution_price": "713.95",
-        "executed_amount": "2",
-        "remaining_amount": "3",
-        "original_amount": "5",
-        "price": "713.95",
-        "socket_sequence": 0
-    }
-    return test_response
+    return dict(_INITIAL_RESPONSE)
 
 
-def test_process_initial(initial_response):
+def test_process_initial(initial_response, gemini_exchange):
     """Test that GeminiExchange creates an order for an 'initial' response."""
-    exchange = GeminiExchange()
+    exchange = gemini_exchange
     # Test that the initial order is added to the exchange state.
     exchange._handle_orders(initial_response)
     order = exchange.exchange_state.order(initial_response['order_id'])
@@ -195,16 +222,16 @@ def accepted_limit_bid_response():
     return test_response, action
 
 
-def test_process_accepted_limit_bid(accepted_limit_bid_response):
+def test_process_accepted_limit_bid(accepted_limit_bid_response, gemini_exchange):
     """Test that a limit buy accepted response is processed correctly."""
     response = accepted_limit_bid_response[0]
     action = accepted_limit_bid_response[1]
-    exchange = GeminiExchange()
+    exchange = gemini_exchange
 
     # Test that the initial order is added to the exchange state.
     # Setup
-    # First we need to hackily add a fake action to the action list.
-    exchange._create_actions = [action]
+    # First we need to hackily add a fake action to the action dict.
+    exchange._create_actions = {id(action): action}
 
     # Action
     exchange._handle_orders(response)
@@ -221,7 +248,7 @@ def test_process_accepted_limit_bid(accepted_limit_bid_response):
     assert action.order == order
 
     # Test that an exception is thrown if there is no matching action.
-    exchange._create_actions = []
+    exchange._create_actions = {}
     with pytest.raises(Exception):
         exchange._handle_orders(response)
 
@@ -254,15 +281,15 @@ def accepted_market_sell_response():
     return test_response, action
 
 
-def test_process_accepted_market_sell(accepted_market_sell_response):
+def test_process_accepted_market_sell(accepted_market_sell_response, gemini_exchange):
     response = accepted_market_sell_response[0]
     action = accepted_market_sell_response[1]
-    exchange = GeminiExchange()
+    exchange = gemini_exchange
 
     # Test that the initial order is added to the exchange state.
     # Setup
-    # First we need to hackily add a fake action to the action list.
-    exchange._create_actions = [action]
+    # First we need to hackily add a fake action to the action dict.
+    exchange._create_actions = {id(action): action}
 
     # Action
     exchange._handle_orders(response)
@@ -277,7 +304,7 @@ def test_process_accepted_market_sell(accepted_market_sell_response):
     assert action.order == order
 
     # Test that an exception is thrown if there is no matching action.
-    exchange._create_actions = []
+    exchange._create_actions = {}
     with pytest.raises(Exception):
         exchange._handle_orders(response)
 
@@ -313,15 +340,15 @@ def rejected_response():
     return test_response, action
 
 
-def test_process_rejected(rejected_response):
+def test_process_rejected(rejected_response, gemini_exchange):
     response = rejected_response[0]
     action = rejected_response[1]
-    exchange = GeminiExchange()
+    exchange = gemini_exchange
 
     # Test that the initial order is added to the exchange state.
     # Setup
-    # First we need to hackily add a fake action to the action list.
-    exchange._create_actions = [action]
+    # First we need to hackily add a fake action to the action dict.
+    exchange._create_actions = {id(action): action}
 
     # Action
     exchange._handle_orders(response)
@@ -336,7 +363,7 @@ def test_process_rejected(rejected_response):
     assert action.order == order
 
     # Test that an exception is thrown if there is no matching action.
-    exchange._create_actions = []
+    exchange._create_actions = {}
     with pytest.raises(Exception):
         exchange._handle_orders(response)
 
@@ -387,12 +414,12 @@ def complete_fill_response():
     return test_response, order
 
 
-def test_process_complete_fill(complete_fill_response):
+def test_process_complete_fill(complete_fill_response, gemini_exchange):
     response = complete_fill_response[0]
     order = complete_fill_response[1]
 
     # Setup
-    exchange = GeminiExchange()
+    exchange = gemini_exchange
     exchange.exchange_state.set_order(order.order_id, order)
 
     # Action
@@ -467,12 +494,12 @@ def partial_fill_response():
     return test_response, order
 
 
-def test_process_partial_fill(partial_fill_response):
+def test_process_partial_fill(partial_fill_response, gemini_exchange):
     response = partial_fill_response[0]
     order = partial_fill_response[1]
 
     # Setup
-    exchange = GeminiExchange()
+    exchange = gemini_exchange
     exchange.exchange_state.set_order(order.order_id, order)
 
     # Action
@@ -533,13 +560,13 @@ def cancelled_response():
     return test_response, order, cancelled_action
 
 
-def test_process_cancelled(cancelled_response):
+def test_process_cancelled(cancelled_response, gemini_exchange):
     response = cancelled_response[0]
     order = cancelled_response[1]
     cancel_action = cancelled_response[2]
 
     # Setup
-    exchange = GeminiExchange()
+    exchange = gemini_exchange
     exchange.exchange_state.set_order(order.order_id, order)
     exchange._cancel_actions = {order.order_id: cancel_action}
 
@@ -611,13 +638,13 @@ def cancel_rejected_response():
     return test_response, order, cancelled_action
 
 
-def test_process_cancel_rejected(cancel_rejected_response):
+def test_process_cancel_rejected(cancel_rejected_response, gemini_exchange):
     response = cancel_rejected_response[0]
     order = cancel_rejected_response[1]
     cancel_action = cancel_rejected_response[2]
 
     # Setup
-    exchange = GeminiExchange()
+    exchange = gemini_exchange
     exchange.exchange_state.set_order(order.order_id, order)
     exchange._cancel_actions = {order.order_id: cancel_action}
 
@@ -688,12 +715,12 @@ def closed_response():
     return test_response, order
 
 
-def test_process_closed(closed_response):
+def test_process_closed(closed_response, gemini_exchange):
     response = closed_response[0]
     order = closed_response[1]
 
     # Setup
-    exchange = GeminiExchange()
+    exchange = gemini_exchange
     exchange.exchange_state.set_order(order.order_id, order)
 
     # Action
@@ -711,9 +738,9 @@ def test_process_closed(closed_response):
         exchange._handle_orders(response)
 
 
-def test_unexpected_response_type(closed_response):
+def test_unexpected_response_type(closed_response, gemini_exchange):
     # Setup.
-    exchange = GeminiExchange()
+    exchange = gemini_exchange
     # Change the response type of the (valid) closed response.
     response = closed_response[0]
     response["type"] = "stolen"
@@ -1,70 +1,94 @@
 from kohuhu.gemini import GeminiExchange
 import kohuhu.exchanges as exchanges
-from test.common import wait_until
+from test.common import wait_for_update
 import pytest
 import asyncio
 import os
 import kohuhu.credentials as credentials
 from decimal import Decimal
-import logging
-import test.common
+# The BurpSuite proxy is enabled with the --proxy pytest option (see
+# conftest.py).
 
-credentials.load_credentials()
+# The order size the tests place. Built once here rather than re-parsing the
+# literal inside the test bodies.
+_TRADE_AMOUNT = Decimal("0.00001")
 
-# Disable websockets debug logging for more comprehensible logs when using -s
-logger = logging.getLogger('websockets')
-logger.setLevel(logging.ERROR)
+def _sandbox_exchange():
+    """Builds the sandbox exchange client; shared by the fixtures below."""
+    creds = credentials.credentials_for('gemini_sandbox', owner='kevin')
+    return GeminiExchange(api_credentials=creds, sandbox=True)
 
-# test.common.enableProxy()
 
 @pytest.fixture
-def sandbox_exchange():
-    creds = credentials.credentials_for('gemini_sandbox', owner='kevin')
-    gemini = GeminiExchange(api_credentials=creds, sandbox=True)
-    return gemini
+def sandbox_exchange(_load_credentials):
+    return _sandbox_exchange()
 
 
 def test_get_balance(sandbox_exchange):
     """Get the balance and check that some BTC and USD are present."""
     sandbox_exchange.update_balance()
+    # Snapshot the values once up front; the asserts then work on plain
+    # locals instead of re-querying the balance per check.
     balance = sandbox_exchange.exchange_state.balance()
     assert balance
-    assert balance.free("USD") > Decimal(0)
-    assert balance.free("BTC") > Decimal(0)
-
-
-# Using pytest-asyncio to inject an event loop.
-# Uncomment the following to use the default event loop in tests.
-# The default event loop might be needed if tasks are created from code other
-# than the test code.
-#@pytest.yield_fixture()
-#def event_loop():
-#    """Yield the default event loop."""
-#    loop = asyncio.get_event_loop()
-#    loop.set_debug(False)
-#    yield loop
-#    loop.close()
-
-
-@pytest.fixture
-async def live_sandbox_exchange(event_loop):
-    creds = credentials.credentials_for('gemini_sandbox', owner='kevin')
-    gemini = GeminiExchange(api_credentials=creds, sandbox=True)
+    free_usd = balance.free("USD")
+    free_btc = balance.free("BTC")
+    assert free_usd > Decimal(0)
+    assert free_btc > Decimal(0)
+
+
+@pytest.yield_fixture(scope='module')  # This scope needs to be >= any async fixtures.
+def event_loop():
+    """Yield a fresh event loop for this module.
+
+    The loop is created here rather than taken from asyncio.get_event_loop():
+    closing the shared default loop at module teardown would break any
+    session-scoped fixtures (e.g. in test_gdax.py) that still need to run
+    their teardown on it afterwards."""
+    previous_loop = asyncio.get_event_loop()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    loop.close()
+    asyncio.set_event_loop(previous_loop)
+
+
+@pytest.fixture(scope='module')
+async def _module_live_sandbox_exchange(event_loop, _load_credentials):
+    """One running exchange shared by every test in this module.
+
+    Opening the websockets and waiting for the first order book snapshot per
+    test pays a TLS handshake and warmup each time; sharing the connection
+    pays it once. Tests reset the state they touch via the
+    live_sandbox_exchange fixture."""
+    gemini = _sandbox_exchange()
+    # run_task() returns an already-scheduled future (it is an
+    # asyncio.gather of the client's coroutines), so no ensure_future /
+    # create_task wrapping is needed.
     run_task = gemini.run_task()
-    asyncio.ensure_future(run_task, loop=event_loop)
     yield gemini
-    # From the cancel() docs:
-    #     "This arranges for a CancelledError to be thrown into the wrapped
-    #     coroutine on the next cycle through the event loop."
-    # So we add a sleep call after calling cancel()
+    # Awaiting the cancelled task takes exactly as long as the task needs to
+    # observe the cancellation (typically milliseconds), unlike the fixed
+    # one-second sleep this used to do, and still propagates any exception
+    # the task hit while running.
     run_task.cancel()
-    await asyncio.sleep(1)
     try:
-        run_task.result()
+        await run_task
     except asyncio.CancelledError:
         pass  # We expect a cancelled error
 
 
+@pytest.fixture
+async def live_sandbox_exchange(_module_live_sandbox_exchange):
+    gemini = _module_live_sandbox_exchange
+    # Reset the state that the tests touch. _orders is cleared in place: the
+    # exchange holds a direct reference to the same dict.
+    gemini.exchange_state._orders.clear()
+    gemini._create_actions = {}
+    gemini._cancel_actions = {}
+    return gemini
+
+
 @pytest.mark.asyncio
 async def test_market_buy(live_sandbox_exchange):
     """Executes a market bid and checks that the order is registered."""
@@ -72,13 +96,16 @@ async def test_market_buy(live_sandbox_exchange):
     await gemini.setup_event()
     exchange_state = gemini.exchange_state
 
-    bid_amount = Decimal("0.00001")
+    bid_amount = _TRADE_AMOUNT
     bid_action = exchanges.CreateOrder("gemini_sandbox",
                                        exchanges.Side.BID,
                                        exchanges.Order.Type.MARKET,
                                        amount=bid_amount)
     gemini.execute_action(bid_action)
-    success = await wait_until(lambda: len(exchange_state._orders))
+    # The exchange notifies its publisher whenever the state changes, so wake
+    # on updates rather than polling the order dict.
+    success = await wait_for_update(exchange_state.update_publisher,
+                                    lambda: len(exchange_state._orders))
     assert success
 
 @pytest.mark.asyncio
@@ -86,20 +113,23 @@ async def test_limit_sell(live_sandbox_exchange):
     gemini = live_sandbox_exchange
     await gemini.setup_event()
     exchange_state = gemini.exchange_state
-    success = await wait_until(lambda: len(exchange_state.order_book().asks()))
+    success = await wait_for_update(
+        exchange_state.update_publisher,
+        lambda: len(exchange_state.order_book().asks()))
     assert success
     # Get the top market bid.
     quote = exchange_state.order_book().bids()[0]
     top_bid_amount = quote.quantity
     top_bid_price = quote.price
-    amount = min(Decimal("0.00001"), top_bid_amount)
+    amount = min(_TRADE_AMOUNT, top_bid_amount)
     ask_action = exchanges.CreateOrder("gemini_sandbox",
                                        exchanges.Side.ASK,
                                        exchanges.Order.Type.LIMIT,
                                        amount=amount,
                                        price=top_bid_price)
     gemini.execute_action(ask_action)
-    success = await wait_until(lambda: len(exchange_state._orders))
+    success = await wait_for_update(exchange_state.update_publisher,
+                                    lambda: len(exchange_state._orders))
     assert success
 
 
@@ -109,5 +139,7 @@ async def test_order_book(live_sandbox_exchange):
     gemini = live_sandbox_exchange
     await gemini.setup_event()
     exchange_state = gemini.exchange_state
-    success = await wait_until(lambda: len(exchange_state.order_book().asks()))
+    success = await wait_for_update(
+        exchange_state.update_publisher,
+        lambda: len(exchange_state.order_book().asks()))
     assert success